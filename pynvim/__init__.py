@@ -148,7 +148,11 @@ def attach(
     if not session:
         raise Exception('Unknown session type "%s"' % session_type)
 
-    return Nvim.from_session(session).with_decode(decode)
+    nvim = Nvim.from_session(session)
+    if decode is not True:
+        # from_session already decodes by default, don't build a second Nvim
+        nvim = nvim.with_decode(decode)  # type: ignore[unreachable]
+    return nvim
 
 
 def setup_logging(name: str) -> None:
@@ -5,11 +5,11 @@ instances.
 """
 
 from pynvim.api.buffer import Buffer
-from pynvim.api.common import decode_if_bytes, walk
+from pynvim.api.common import decode_if_bytes, decode_if_bytes_default, walk, walk_decode
 from pynvim.api.nvim import Nvim, NvimError
 from pynvim.api.tabpage import Tabpage
 from pynvim.api.window import Window
 
 
 __all__ = ('Nvim', 'Buffer', 'Window', 'Tabpage', 'NvimError',
-           'decode_if_bytes', 'walk')
+           'decode_if_bytes', 'decode_if_bytes_default', 'walk', 'walk_decode')
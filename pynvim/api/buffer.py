@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from typing import (Any, Iterator, List, Optional, TYPE_CHECKING, Tuple, Union, cast,
-                    overload)
+from typing import (Any, Iterator, List, Optional, Sequence, TYPE_CHECKING, Tuple, Union,
+                    cast, overload)
 
 from pynvim.api.common import Remote
 from pynvim.compat import check_async
@@ -14,6 +14,10 @@ if TYPE_CHECKING:
 
 __all__ = ('Buffer',)
 
+# msgpack serializes tuples as arrays, so an immutable empty tuple can be
+# shared by every request that clears lines.
+_EMPTY: Tuple[str, ...] = ()
+
 
 @overload
 def adjust_index(idx: int, default: Optional[int] = None) -> int:
@@ -44,7 +48,11 @@ class Buffer(Remote):
 
     """A remote Nvim buffer."""
 
+    __slots__ = ()
+
     _api_prefix = "nvim_buf_"
+    _vars_methods = ('nvim_buf_get_var', 'nvim_buf_set_var', 'nvim_buf_del_var')
+    _options_methods = ('nvim_buf_get_option', 'nvim_buf_set_option')
     _session: "Nvim"
 
     def __init__(self, session: Nvim, code_data: Tuple[int, Any]):
@@ -73,8 +81,10 @@ class Buffer(Remote):
         When retrieving slices, omitting indexes(eg: `buffer[:]`) will bring
         the whole buffer.
         """
-        if not isinstance(idx, slice):
-            i = adjust_index(idx)
+        # The conversion of a single index is inlined (instead of calling
+        # adjust_index) since subscripting is on the hot path of most plugins.
+        if type(idx) is not slice:
+            i = idx - 1 if idx < 0 else idx
             return self.request('nvim_buf_get_lines', i, i + 1, True)[0]
         start = adjust_index(idx.start, 0)
         end = adjust_index(idx.stop, -1)
@@ -100,15 +110,16 @@ class Buffer(Remote):
         When replacing slices, omitting indexes(eg: `buffer[:]`) will replace
         the whole buffer.
         """
-        if not isinstance(idx, slice):
+        if type(idx) is not slice:
             assert not isinstance(item, list)
-            i = adjust_index(idx)
-            lines = [item] if item is not None else []
-            return self.request('nvim_buf_set_lines', i, i + 1, True, lines)
+            i = idx - 1 if idx < 0 else idx
+            return self.request('nvim_buf_set_lines', i, i + 1, True,
+                                (item,) if item is not None else _EMPTY)
+        lines: Sequence[str]
         if item is None:
-            lines = []
+            lines = _EMPTY
         elif isinstance(item, str):
-            lines = [item]
+            lines = (item,)
         else:
             lines = item
         start = adjust_index(idx.start, 0)
@@ -123,23 +134,20 @@ class Buffer(Remote):
         minimizing the number of API calls by transferring all data needed to
         work.
         """
-        lines = self[:]
-        for line in lines:
-            yield line
+        return iter(self[:])
 
     def __delitem__(self, idx: Union[int, slice]) -> None:
         """Delete line or slice of lines from the buffer.
 
         This is the same as __setitem__(idx, [])
         """
-        self.__setitem__(idx, None)
-
-    def __ne__(self, other: Any) -> bool:
-        """Test inequality of Buffers.
-
-        Necessary for Python 2 compatibility.
-        """
-        return not self.__eq__(other)
+        if type(idx) is not slice:
+            i = idx - 1 if idx < 0 else idx
+            self.request('nvim_buf_set_lines', i, i + 1, True, _EMPTY)
+            return
+        start = adjust_index(idx.start, 0)
+        end = adjust_index(idx.stop, -1)
+        self.request('nvim_buf_set_lines', start, end, False, _EMPTY)
 
     def append(
         self, lines: Union[str, bytes, List[Union[str, bytes]]], index: int = -1
@@ -250,6 +258,8 @@ class Buffer(Remote):
 
 class Range:
 
+    __slots__ = ('_buffer', 'start', 'end')
+
     def __init__(self, buffer: Buffer, start: int, end: int):
         self._buffer = buffer
         self.start = start - 1
@@ -267,7 +277,7 @@ class Range:
         ...
 
     def __getitem__(self, idx: Union[int, slice]) -> Union[str, List[str]]:
-        if not isinstance(idx, slice):
+        if type(idx) is not slice:
             return self._buffer[self._normalize_index(idx)]
         start = self._normalize_index(idx.start)
         end = self._normalize_index(idx.stop)
@@ -288,7 +298,7 @@ class Range:
     def __setitem__(
         self, idx: Union[int, slice], lines: Union[None, str, List[str]]
     ) -> None:
-        if not isinstance(idx, slice):
+        if type(idx) is not slice:
             assert not isinstance(lines, list)
             self._buffer[self._normalize_index(idx)] = lines
             return
@@ -301,8 +311,12 @@ class Range:
         self._buffer[start:end + 1] = lines
 
     def __iter__(self) -> Iterator[str]:
-        for i in range(self.start, self.end + 1):
-            yield self._buffer[i]
+        start, end = self.start, self.end
+        if start <= end:
+            # strict, like indexing each line: a line outside the buffer
+            # raises instead of being left out.
+            yield from self._buffer.request('nvim_buf_get_lines',
+                                            start, end + 1, True)
 
     def append(
         self, lines: Union[str, bytes, List[Union[str, bytes]]], i: Optional[int] = None
@@ -1,9 +1,11 @@
 """Code shared between the API classes."""
+from __future__ import annotations
+
 import functools
 import sys
 from abc import ABC, abstractmethod
-from typing import (Any, Callable, Generic, Iterator, List, Optional, Tuple, TypeVar,
-                    Union, overload)
+from typing import (Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple, Type,
+                    TypeVar, Union, overload)
 
 from msgpack import unpackb
 if sys.version_info < (3, 8):
@@ -28,6 +30,9 @@ class IRemote(Protocol):
     def request(self, name: str, *args: Any, **kwargs: Any) -> Any:
         raise NotImplementedError
 
+    def _has_key(self, get_method: str, *args: Any) -> Optional[bool]:
+        raise NotImplementedError
+
 
 class Remote(ABC):
 
@@ -38,6 +43,9 @@ class Remote(ABC):
     object handle into consideration.
     """
 
+    __slots__ = ('_session', '_do_request', 'code_data', '_hash', 'handle', '_api',
+                 '_vars', '_options', '__weakref__')
+
     def __init__(self, session: IRemote, code_data: Tuple[int, Any]):
         """Initialize from session and code_data immutable object.
 
@@ -45,20 +53,50 @@ class Remote(ABC):
         msgpack-rpc calls. It must be immutable for Buffer equality to work.
         """
         self._session = session
+        self._do_request = session.request
         self.code_data = code_data
+        self._hash = code_data.__hash__()
         self.handle = unpackb(code_data[1])
-        self.api = RemoteApi(self, self._api_prefix)
-        self.vars = RemoteMap(self, self._api_prefix + 'get_var',
-                              self._api_prefix + 'set_var',
-                              self._api_prefix + 'del_var')
-        self.options = RemoteMap(self, self._api_prefix + 'get_option',
-                                 self._api_prefix + 'set_option')
+        # Most objects are created from responses and never use these, so
+        # they are only built on first access.
+        self._api: Optional[RemoteApi] = None
+        self._vars: Optional[RemoteMap] = None
+        self._options: Optional[RemoteMap] = None
 
     @property
     @abstractmethod
     def _api_prefix(self) -> str:
         raise NotImplementedError()
 
+    # Method names of the `vars` and `options` maps, spelled out by each
+    # subclass so they are not rebuilt for every new object.
+    _vars_methods: Tuple[str, str, str]
+    _options_methods: Tuple[str, str]
+
+    @property
+    def api(self) -> RemoteApi:
+        """Wrapper to call the API functions of this object as methods."""
+        api = self._api
+        if api is None:
+            api = self._api = RemoteApi(self, self._api_prefix)
+        return api
+
+    @property
+    def vars(self) -> RemoteMap:
+        """Variables of this object, as a dict-like `RemoteMap`."""
+        vars = self._vars
+        if vars is None:
+            vars = self._vars = RemoteMap(self, *self._vars_methods)
+        return vars
+
+    @property
+    def options(self) -> RemoteMap:
+        """Options of this object, as a dict-like `RemoteMap`."""
+        options = self._options
+        if options is None:
+            options = self._options = RemoteMap(self, *self._options_methods)
+        return options
+
     def __repr__(self) -> str:
         """Get text representation of the object."""
         return '<%s(handle=%r)>' % (
@@ -68,29 +106,43 @@ class Remote(ABC):
 
     def __eq__(self, other: Any) -> bool:
         """Return True if `self` and `other` are the same object."""
-        return (hasattr(other, 'code_data')
-                and other.code_data == self.code_data)
+        try:
+            return other.code_data == self.code_data
+        except AttributeError:
+            return NotImplemented
 
     def __hash__(self) -> int:
         """Return hash based on remote object id."""
-        return self.code_data.__hash__()
+        return self._hash
 
     def request(self, name: str, *args: Any, **kwargs: Any) -> Any:
         """Wrapper for nvim.request."""
-        return self._session.request(name, self, *args, **kwargs)
+        return self._do_request(name, self, *args, **kwargs)
+
+    def _has_key(self, get_method: str, *args: Any) -> Optional[bool]:
+        """Wrapper for nvim._has_key."""
+        return self._session._has_key(get_method, self, *args)
 
 
 class RemoteApi:
     """Wrapper to allow api methods to be called like python methods."""
 
+    __slots__ = ('_obj', '_api_prefix', '_cache')
+
     def __init__(self, obj: IRemote, api_prefix: str):
         """Initialize a RemoteApi with object and api prefix."""
         self._obj = obj
         self._api_prefix = api_prefix
+        self._cache: Dict[str, Callable[..., Any]] = {}
 
     def __getattr__(self, name: str) -> Callable[..., Any]:
         """Return wrapper to named api method."""
-        return functools.partial(self._obj.request, self._api_prefix + name)
+        method = self._cache.get(name)
+        if method is None:
+            method = functools.partial(self._obj.request, self._api_prefix + name)
+            if not name.startswith('__'):
+                self._cache[name] = method
+        return method
 
 
 E = TypeVar('E', bound=Exception)
@@ -115,8 +167,7 @@ class RemoteMap:
     It is used to provide a dict-like API to vim variables and options.
     """
 
-    _set = None
-    _del = None
+    __slots__ = ('_obj', '_get_method', '_get', '_set', '_del')
 
     def __init__(
         self,
@@ -126,7 +177,11 @@ class RemoteMap:
         del_method: Optional[str] = None
     ):
         """Initialize a RemoteMap with session, getter/setter."""
+        self._obj = obj
+        self._get_method = get_method
         self._get = functools.partial(obj.request, get_method)
+        self._set: Optional[Callable[..., Any]] = None
+        self._del: Optional[Callable[..., Any]] = None
         if set_method:
             self._set = functools.partial(obj.request, set_method)
         if del_method:
@@ -155,7 +210,18 @@ class RemoteMap:
             raise transform_keyerror(exc)
 
     def __contains__(self, key: str) -> bool:
-        """Check if key is present in the map."""
+        """Check if key is present in the map.
+
+        The lookup is made on the Nvim side, so the value is not transferred.
+        If that can't tell, the value is requested, and any error means the
+        key is not present.
+        """
+        try:
+            found = self._obj._has_key(self._get_method, key)
+        except Exception:
+            found = None
+        if found is not None:
+            return found
         try:
             self._get(key)
             return True
@@ -193,6 +259,8 @@ class RemoteSequence(Generic[T]):
     locally(iteration, indexing, counting, etc).
     """
 
+    __slots__ = ('_fetch',)
+
     def __init__(self, session: IRemote, method: str):
         """Initialize a RemoteSequence with session, method."""
         self._fetch = functools.partial(session.request, method)
@@ -209,15 +277,13 @@ class RemoteSequence(Generic[T]):
 
     def __getitem__(self, idx: Union[slice, int]) -> Union[T, List[T]]:
         """Return a sequence item by index."""
-        if not isinstance(idx, slice):
+        if type(idx) is not slice:
             return self._fetch()[idx]
         return self._fetch()[idx.start:idx.stop]
 
     def __iter__(self) -> Iterator[T]:
         """Return an iterator for the sequence."""
-        items = self._fetch()
-        for item in items:
-            yield item
+        return iter(self._fetch())
 
     def __contains__(self, item: T) -> bool:
         """Check if an item is present in the sequence."""
@@ -241,15 +307,49 @@ def decode_if_bytes(obj: T, mode: TDecodeMode = True) -> Union[T, str]:
     return obj
 
 
+def decode_if_bytes_default(
+    obj: Any, _errors: str = unicode_errors_default, _bytes: Type[bytes] = bytes
+) -> Any:
+    """Like `decode_if_bytes(obj)`, specialized for the default mode.
+
+    This is applied to every leaf of a response, so the mode resolution is
+    skipped and the globals are bound as default arguments.
+    """
+    if type(obj) is _bytes:
+        return obj.decode("utf-8", _errors)
+    return obj
+
+
+CONTAINER_TYPES = frozenset((list, tuple, dict))
+
+
 def walk(fn: Callable[[Any], Any], obj: Any) -> Any:
     """Recursively walk an object graph applying `fn` to objects."""
 
     # Note: this function is very hot, so it is worth being careful
-    # about performance.
+    # about performance. Most objects are scalars, so those are dispatched
+    # with a single set lookup before testing for the container types.
     type_ = type(obj)
 
-    if type_ is list or type_ is tuple:
-        return [walk(fn, o) for o in obj]
+    if type_ not in CONTAINER_TYPES:
+        return fn(obj)
     if type_ is dict:
         return {walk(fn, k): walk(fn, v) for k, v in obj.items()}
-    return fn(obj)
+    return [walk(fn, o) for o in obj]
+
+
+def walk_decode(obj: Any, errors: str = unicode_errors_default) -> Any:
+    """Recursively decode all bytes objects of an object graph.
+
+    This is the same as `walk(partial(decode_if_bytes, mode=errors), obj)`,
+    but fused into a single function to save a call for every node.
+    """
+    type_ = type(obj)
+
+    if type_ is bytes:
+        return obj.decode("utf-8", errors)
+    if type_ not in CONTAINER_TYPES:
+        return obj
+    if type_ is dict:
+        return {walk_decode(k, errors): walk_decode(v, errors) for k, v in obj.items()}
+    return [walk_decode(o, errors) for o in obj]
@@ -3,23 +3,29 @@
 from __future__ import annotations
 
 import asyncio
+import operator
 import os
 import sys
 import threading
+from contextlib import contextmanager
 from functools import partial
-from traceback import format_stack
 from types import SimpleNamespace
-from typing import (Any, AnyStr, Callable, Dict, Iterator, List, Optional,
-                    TYPE_CHECKING, Union)
+from typing import (Any, AnyStr, Callable, Dict, Iterator, List, NamedTuple, Optional,
+                    Sequence, TYPE_CHECKING, Tuple, Union)
 
-from msgpack import ExtType
+import greenlet
+
+from msgpack import ExtType, packb
 
 from pynvim.api.buffer import Buffer
-from pynvim.api.common import (NvimError, Remote, RemoteApi, RemoteMap, RemoteSequence,
-                               TDecodeMode, decode_if_bytes, walk)
+from pynvim.api.common import (CONTAINER_TYPES, NvimError, Remote, RemoteApi, RemoteMap,
+                               RemoteSequence, TDecodeMode, decode_if_bytes,
+                               decode_if_bytes_default)
 from pynvim.api.tabpage import Tabpage
 from pynvim.api.window import Window
-from pynvim.util import format_exc_skip
+from pynvim.compat import check_async, unicode_errors_default
+from pynvim.util import (TStackEntry, capture_stack, format_captured_stack,
+                         format_exc_skip)
 
 if TYPE_CHECKING:
     from pynvim.msgpack_rpc import Session
@@ -52,12 +58,53 @@ local function update_highlights(buf, src_id, hls, clear_first, clear_end)
   end
 end
 
+local function has_key(get_method, ...)
+  local get = a[get_method]
+  if get == nil then
+    return nil
+  end
+  local ok, err = pcall(get, ...)
+  if ok then
+    return true
+  end
+  err = tostring(err)
+  if err:find('^Key not found:') or err:find('^Invalid option name:') then
+    return false
+  end
+  -- unknown failure, let the client decide
+  return nil
+end
+
 local chid = ...
-local mod = {update_highlights=update_highlights}
+local mod = {update_highlights=update_highlights, has_key=has_key}
 _G["_pynvim_"..chid] = mod
 """
 
 
+# Types that `_from_nvim` returns unchanged, whatever the decode mode.
+_IMMUTABLE_TYPES = frozenset((int, bool, float, str, type(None)))
+
+# Methods whose result is a flat list of strings. Such results can be large
+# (a whole buffer), so they are converted in one pass without recursion.
+_STR_LIST_METHODS = frozenset((
+    'nvim_buf_get_lines',
+    'nvim_buf_get_text',
+    'nvim_list_runtime_paths',
+    'nvim_get_runtime_file',
+))
+
+
+def _decode_errors(decode: TDecodeMode) -> Optional[str]:
+    """Return the unicode error handler of a decode mode, if it decodes."""
+    if decode is True:
+        return unicode_errors_default
+    return decode or None
+
+
+def _ignore_err(msg: str) -> None:
+    """Default error callback of `Nvim`, errors are ignored."""
+
+
 class Nvim:
     """Class that represents a remote Nvim instance.
 
@@ -90,10 +137,10 @@ class Nvim:
         creating specialized objects from Nvim remote handles.
         """
         session.error_wrapper = lambda e: NvimError(decode_if_bytes(e[1]))
+        # The metadata is not walked for decoding: the session unpacks msgpack
+        # strings as `str` already, and it does not contain binary values.
         channel_id, metadata = session.request(b'nvim_get_api_info')
 
-        metadata = walk(decode_if_bytes, metadata)
-
         types = {
             metadata['types']['Buffer']['id']: Buffer,
             metadata['types']['Window']['id']: Window,
@@ -139,8 +186,18 @@ class Nvim:
         self.lua = LuaFuncs(self)
         self.error = NvimError
         self._decode = decode
+        self._decode_errors = _decode_errors(decode)
+        # active `batch` of each greenlet: requests made by other handlers
+        # while a batch is flushed must not be deferred by it
+        self._batches: Dict[Any, Batch] = {}
+        self._lua_private: Optional[LuaFuncs] = None
+        # state of `cached_rtp`: whether it is active, and the paths once
+        # they have been fetched
+        self._rtp_caching = False
+        self._rtp_cache: Optional[List[str]] = None
+        self._remotes: Dict[ExtType, Remote] = {}
         if err_cb is None:
-            self._err_cb: Callable[[str], Any] = lambda _: None
+            self._err_cb: Callable[[str], Any] = _ignore_err
         else:
             self._err_cb = err_cb
 
@@ -155,27 +212,83 @@ class Nvim:
         return self._session.loop._loop  # type: ignore
 
     def _from_nvim(self, obj: Any, decode: Optional[TDecodeMode] = None) -> Any:
+        type_ = type(obj)
+        if type_ in _IMMUTABLE_TYPES:
+            return obj
+        if type_ is ExtType:
+            code, data = obj
+            return self.types[code](self, (code, data))
         if decode is None:
             decode = self._decode
-        if type(obj) is ExtType:
-            cls = self.types[obj.code]
-            return cls(self, (obj.code, obj.data))
+        if decode is True:
+            return decode_if_bytes_default(obj)
         if decode:
             obj = decode_if_bytes(obj, decode)
         return obj
 
-    def _to_nvim(self, obj: Any) -> Any:
-        if isinstance(obj, Remote):
-            return ExtType(*obj.code_data)
+    # The methods below are `walk` fused with `_from_nvim`: they are
+    # applied to every node of every response, so the leaf conversion is
+    # inlined instead of costing an extra call per node. Outgoing payloads
+    # are not walked: remote objects are converted by the msgpack packer.
+
+    def _walk_from_nvim(self, obj: Any, decode: Optional[TDecodeMode] = None) -> Any:
+        if decode is None or decode is self._decode:
+            errors = self._decode_errors
+        else:
+            errors = _decode_errors(decode)
+        return self._convert_message(obj, errors)
+
+    def _convert_message(self, obj: Any, errors: Optional[str]) -> Any:
+        try:
+            return self._convert_from_nvim(obj, errors)
+        finally:
+            # remote objects are only shared within a message, so that a
+            # stale object is never returned for a later one
+            self._remotes.clear()
+
+    def _convert_from_nvim(self, obj: Any, errors: Optional[str]) -> Any:
+        # `errors` is the resolved decode mode, None when decoding is off
+        type_ = type(obj)
+        if type_ is list or type_ is tuple:
+            convert = self._convert_from_nvim
+            return [convert(o, errors) for o in obj]
+        if type_ is dict:
+            convert = self._convert_from_nvim
+            return {convert(k, errors): convert(v, errors) for k, v in obj.items()}
+        if type_ is ExtType:
+            # large messages (e.g. UI events) often repeat the same handles
+            remote = self._remotes.get(obj)
+            if remote is None:
+                code, data = obj
+                remote = self._remotes[obj] = self.types[code](self, (code, data))
+            return remote
+        if type_ is bytes and errors is not None:
+            return obj.decode("utf-8", errors)
         return obj
 
     def _get_lua_private(self) -> LuaFuncs:
-        if not getattr(self._session, "_has_lua", False):
-            self.exec_lua(lua_module, self.channel_id)
-            self._session._has_lua = True  # type: ignore[attr-defined]
-        return getattr(self.lua, "_pynvim_{}".format(self.channel_id))
+        lua = self._lua_private
+        if lua is None:
+            if not getattr(self._session, "_has_lua", False):
+                # Wait for the definition, bypassing any open batch, and
+                # only then mark the session so a failure is retried.
+                self._session.request('nvim_exec_lua', lua_module,
+                                      [self.channel_id])
+                self._session._has_lua = True  # type: ignore[attr-defined]
+            lua = LuaFuncs(self, "_pynvim_{}".format(self.channel_id))
+            self._lua_private = lua
+        return lua
+
+    def _has_key(self, get_method: str, *args: Any) -> Optional[bool]:
+        """Return whether the `get_method` API call would find its key.
+
+        Return None if it can't be told: the method doesn't exist, or it
+        failed with an error other than a missing key or option.
+        """
+        return self._get_lua_private().has_key(get_method, *args)
 
-    def request(self, name: str, *args: Any, **kwargs: Any) -> Any:
+    def request(self, name: str, *args: Any, decode: Any = None,
+                async_: Optional[bool] = None, **kwargs: Any) -> Any:
         r"""Send an API request or notification to nvim.
 
         It is rarely needed to call this function directly, as most API
@@ -195,21 +308,45 @@ class Nvim:
         present and True, a asynchronous notification is sent instead. This
         will never block, and the return value or error is ignored.
         """
-        if (self._session._loop_thread is not None
-                and threading.current_thread() != self._session._loop_thread):
-
-            msg = ("Request from non-main thread.\n"
-                   "Requests from different threads should be wrapped "
-                   "with nvim.async_call(cb, ...) \n{}\n"
-                   .format('\n'.join(format_stack(None, 5)[:-1])))
-
-            self.async_call(self._err_cb, msg)
+        session = self._session
+        loop_thread_id = session._loop_thread_id
+        if loop_thread_id is not None and threading.get_ident() != loop_thread_id:
+
+            if self._err_cb is not _ignore_err:
+                # the message is formatted by the loop thread
+                self._session.threadsafe_call(self._report_thread_violation,
+                                              capture_stack(1, 4))
             raise NvimError("request from non-main thread")
 
-        decode = kwargs.pop('decode', self._decode)
-        args = walk(self._to_nvim, args)
-        res = self._session.request(name, *args, **kwargs)
-        return walk(partial(self._from_nvim, decode=decode), res)
+        if decode is None:
+            decode = self._decode
+        if kwargs:
+            # the deprecated 'async' keyword
+            async_ = check_async(async_, kwargs, False)
+        batches = self._batches
+        if batches:
+            batch = batches.get(greenlet.getcurrent())
+            if batch is not None:
+                if not async_:
+                    return batch.add(name, args, decode, **kwargs)
+                # keep the notification ordered after the deferred requests
+                batch.flush()
+        res = session.request(name, *args, async_=async_, **kwargs)
+        if type(res) not in CONTAINER_TYPES:
+            # most responses are scalars, which don't need to be walked
+            return self._from_nvim(res, decode)
+        if name in _STR_LIST_METHODS and type(res) is list:
+            errors = self._decode_errors if decode is self._decode else _decode_errors(decode)
+            if errors is None:
+                return res
+            return [s.decode("utf-8", errors) if type(s) is bytes else s for s in res]
+        return self._walk_from_nvim(res, decode)
+
+    def _report_thread_violation(self, stack: List[TStackEntry]) -> None:
+        self._err_cb("Request from non-main thread.\n"
+                     "Requests from different threads should be wrapped "
+                     "with nvim.async_call(cb, ...) \n{}\n"
+                     .format(format_captured_stack(stack)))
 
     def next_message(self) -> Any:
         """Block until a message(request or notification) is available.
@@ -219,7 +356,7 @@ class Nvim:
         """
         msg = self._session.next_message()
         if msg:
-            return walk(self._from_nvim, msg)
+            return self._walk_from_nvim(msg)
 
     def run_loop(
         self,
@@ -236,10 +373,14 @@ class Nvim:
         if err_cb is None:
             err_cb = sys.stderr.write
         self._err_cb = err_cb
+        # The filters below run for every message, the conversion of their
+        # arguments is resolved once here.
+        convert = self._convert_message
+        errors = self._decode_errors
 
         def filter_request_cb(name: str, args: Any) -> Any:
             name = self._from_nvim(name)
-            args = walk(self._from_nvim, args)
+            args = convert(args, errors)
             try:
                 result = request_cb(name, args)  # type: ignore[misc]
             except Exception:
@@ -247,11 +388,11 @@ class Nvim:
                        .format(name, args, format_exc_skip(1)))
                 self._err_cb(msg)
                 raise
-            return walk(self._to_nvim, result)
+            return result
 
         def filter_notification_cb(name: str, args: Any) -> None:
             name = self._from_nvim(name)
-            args = walk(self._from_nvim, args)
+            args = convert(args, errors)
             try:
                 notification_cb(name, args)  # type: ignore[misc]
             except Exception:
@@ -281,6 +422,28 @@ class Nvim:
         """
         self.close()
 
+    def batch(self) -> Batch:
+        """Defer the requests made inside a `with` block to a single RPC.
+
+        Requests made on this instance (including its `api`, `funcs` and
+        remote objects) by the code running the block are not sent right away.
+        Instead, each request returns a `BatchResult`, and all of them are
+        sent when the block exits, as one `nvim_call_atomic` round-trip:
+
+            with nvim.batch():
+                count = buf.api.line_count()
+                nvim.api.command('redraw')
+            print(count.result)
+
+        Accessing `result` inside the block sends the requests deferred so
+        far. Wrappers that post-process the result of a request (such as
+        `Buffer.__getitem__` or `Window.cursor`) must not be used inside the
+        block; those that test it (such as `'x' in nvim.vars`) raise
+        TypeError. If the block raises, the deferred requests are discarded,
+        and reading their `result` raises NvimError.
+        """
+        return Batch(self)
+
     def with_decode(self, decode: Literal[True] = True) -> Nvim:
         """Initialize a new Nvim instance."""
         return Nvim(self._session, self.channel_id,
@@ -364,8 +527,29 @@ class Nvim:
 
     def list_runtime_paths(self) -> List[str]:
         """Return a list of paths contained in the 'runtimepath' option."""
+        if self._rtp_caching:
+            paths = self._rtp_cache
+            if paths is None:
+                paths = self._rtp_cache = self.request('nvim_list_runtime_paths')
+            return list(paths)
         return self.request('nvim_list_runtime_paths')
 
+    @contextmanager
+    def cached_rtp(self) -> Iterator[None]:
+        """Reuse the 'runtimepath' list within a block.
+
+        Inside the `with` block, `list_runtime_paths` and `foreach_rtp` make
+        at most one request. Changes to 'runtimepath' made inside the block
+        are not seen, except through `chdir`, which clears the cache.
+        """
+        outer = self._rtp_caching, self._rtp_cache
+        self._rtp_caching = True
+        self._rtp_cache = None
+        try:
+            yield
+        finally:
+            self._rtp_caching, self._rtp_cache = outer
+
     def foreach_rtp(self, cb: Callable[[str], Any]) -> None:
         """Invoke `cb` for each path in 'runtimepath'.
 
@@ -383,6 +567,7 @@ class Nvim:
 
     def chdir(self, dir_path: str) -> None:
         """Run os.chdir, then all appropriate vim stuff."""
+        self._rtp_cache = None
         os_chdir(dir_path)
         return self.request('nvim_set_current_dir', dir_path)
 
@@ -438,13 +623,14 @@ class Nvim:
             # special case: if a non-main thread writes to stderr
             # i.e. due to an uncaught exception, pass it through
             # without raising an additional exception.
-            self.async_call(self.err_write, msg, **kwargs)
+            # (no async_call, as its call point is not needed here)
+            self._session.threadsafe_call(self.err_write, msg, **kwargs)
             return
         return self.request('nvim_err_write', msg, **kwargs)
 
     def _thread_invalid(self) -> bool:
-        return (self._session._loop_thread is not None
-                and threading.current_thread() != self._session._loop_thread)
+        loop_thread_id = self._session._loop_thread_id
+        return loop_thread_id is not None and threading.get_ident() != loop_thread_id
 
     def quit(self, quit_command: str = 'qa!') -> None:
         """Send a quit command to Nvim.
@@ -474,7 +660,10 @@ class Nvim:
         event handler, just before it returns, to defer execution
         that shouldn't block neovim.
         """
-        call_point = ''.join(format_stack(None, 5)[:-1])
+        # Formatting the stack is expensive, so only the frame locations are
+        # captured here, and only if someone listens.
+        call_point = (None if self._err_cb is _ignore_err
+                      else capture_stack(1, 4))
 
         def handler() -> None:
             try:
@@ -482,37 +671,205 @@ class Nvim:
             except Exception as err:
                 msg = ("error caught while executing async callback:\n"
                        "{!r}\n{}\n \nthe call was requested at\n{}"
-                       .format(err, format_exc_skip(1), call_point))
+                       .format(err, format_exc_skip(1),
+                               '<unknown>' if call_point is None
+                               else format_captured_stack(call_point)))
                 self._err_cb(msg)
                 raise
         self._session.threadsafe_call(handler)
 
 
+class Batch(object):
+
+    """Requests deferred by `Nvim.batch`.
+
+    The requests are sent together with `nvim_call_atomic` by `flush`, which
+    is called when the `with` block exits. As with `nvim_call_atomic`, the
+    requests following a failed one are not executed; the error is raised
+    when the block exits or when the `result` of one of them is accessed.
+
+    A batch entered while another one is active joins it, so that all the
+    requests are sent in the order they were made.
+    """
+
+    def __init__(self, nvim: Nvim):
+        self._nvim = nvim
+        self._greenlet: Any = None
+        self._joined = False
+        self._calls: List[List[Any]] = []
+        self._results: List[Tuple[BatchResult, TDecodeMode]] = []
+        # error of a flush that wasn't raised yet
+        self._error: Optional[Exception] = None
+
+    def __enter__(self) -> Batch:
+        batches = self._nvim._batches
+        current = greenlet.getcurrent()
+        outer = batches.get(current)
+        if outer is not None:
+            # the outer batch flushes (or discards) the requests
+            self._joined = True
+            return outer
+        batches[current] = self
+        self._greenlet = current
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if self._joined:
+            self._joined = False
+            return
+        del self._nvim._batches[self._greenlet]
+        self._greenlet = None
+        if exc_type is None:
+            self.flush()
+            error, self._error = self._error, None
+            if error is not None:
+                raise error
+        else:
+            discarded = NvimError('request discarded, the batch block raised {!r}'
+                                  .format(exc))
+            for result, _ in self._results:
+                result._error = discarded
+                result._done = True
+            self._calls = []
+            self._results = []
+            self._error = None
+
+    def add(self, name: str, args: Sequence[Any], decode: TDecodeMode,
+            **kwargs: Any) -> BatchResult:
+        """Defer a request."""
+        if kwargs:
+            raise ValueError("request got unsupported keyword argument(s): {}"
+                             .format(', '.join(kwargs.keys())))
+        result = BatchResult(self)
+        self._calls.append([name, args])
+        self._results.append((result, decode))
+        return result
+
+    def flush(self) -> Optional[Exception]:
+        """Send the deferred requests and resolve their results.
+
+        Return the error of the failed request, if any. It is also raised
+        when the `with` block exits, unless the `result` of a failed request
+        has raised it already.
+        """
+        calls, results = self._calls, self._results
+        if not calls:
+            return None
+        self._calls = []
+        self._results = []
+        nvim = self._nvim
+        try:
+            values, err = nvim._session.request('nvim_call_atomic', calls)
+        except Exception as exc:
+            # none of the requests has a result
+            for result, _ in results:
+                result._error = exc
+                result._done = True
+            raise
+        for (result, decode), value in zip(results, values):
+            result._value = nvim._walk_from_nvim(value, decode)
+            result._done = True
+        if err is not None:
+            # err is [index, error type, message]
+            error = NvimError(decode_if_bytes(err[2]))
+            for result, _ in results[err[0]:]:
+                result._error = error
+                result._done = True
+            if self._error is None:
+                self._error = error
+            return error
+        return None
+
+
+class BatchResult(object):
+
+    """Result of a request deferred by `Nvim.batch`.
+
+    It has no truth value or length, so that code that tests the return
+    value of a request fails instead of getting a wrong answer in a batch.
+    """
+
+    __slots__ = ('_batch', '_value', '_error', '_done')
+
+    def __init__(self, batch: Batch):
+        self._batch = batch
+        self._value: Any = None
+        self._error: Optional[Exception] = None
+        self._done = False
+
+    @property
+    def result(self) -> Any:
+        """Return the result, sending the deferred requests if needed."""
+        if not self._done:
+            self._batch.flush()
+        error = self._error
+        if error is not None:
+            batch = self._batch
+            if batch._error is error:
+                # raised here, not again when the block exits
+                batch._error = None
+            raise error
+        return self._value
+
+    def __bool__(self) -> bool:
+        """Raise TypeError, use `result` once the requests are sent."""
+        raise TypeError('BatchResult has no truth value, use its result')
+
+    def __len__(self) -> int:
+        """Raise TypeError, use `result` once the requests are sent."""
+        raise TypeError('BatchResult has no length, use its result')
+
+
 class Buffers(object):
 
     """Remote NVim buffers.
 
-    Currently the interface for interacting with remote NVim buffers is the
-    `nvim_list_bufs` msgpack-rpc function. Most methods fetch the list of
-    buffers from NVim.
+    Nothing is fetched when the object is created. Iterating fetches the
+    list of buffers with `nvim_list_bufs`, while `len` and lookups by buffer
+    number take a single request each, without fetching the list.
 
     Conforms to *python-buffers*.
     """
 
+    __slots__ = ('_nvim', '_code')
+
     def __init__(self, nvim: Nvim):
         """Initialize a Buffers object with Nvim object `nvim`."""
-        self._fetch_buffers = nvim.api.list_bufs
+        self._nvim = nvim
+        # ext type code of buffer handles, looked up by the first __getitem__
+        self._code: Optional[int] = None
+
+    def _fetch_buffers(self) -> List[Buffer]:
+        return self._nvim.request('nvim_list_bufs')
 
     def __len__(self) -> int:
         """Return the count of buffers."""
-        return len(self._fetch_buffers())
+        # counted by nvim, so no Buffer objects are sent and created
+        return self._nvim.exec_lua('return #vim.api.nvim_list_bufs()')
 
     def __getitem__(self, number: int) -> Buffer:
-        """Return the Buffer object matching buffer number `number`."""
-        for b in self._fetch_buffers():
-            if b.number == number:
-                return b
-        raise KeyError(number)
+        """Return the Buffer object matching buffer number `number`.
+
+        The buffer number is the handle of the buffer, so the Buffer is
+        built locally and a single `nvim_buf_is_valid` request checks that
+        it exists.
+        """
+        try:
+            handle = operator.index(number)
+        except TypeError:
+            raise KeyError(number) from None
+        if handle <= 0:
+            # 0 would be accepted by nvim as the current buffer
+            raise KeyError(number)
+        nvim = self._nvim
+        code = self._code
+        if code is None:
+            code = self._code = next(c for c, cls in nvim.types.items()
+                                     if cls is Buffer)
+        buffer = Buffer(nvim, (code, packb(handle)))
+        if not nvim.request('nvim_buf_is_valid', buffer):
+            raise KeyError(number)
+        return buffer
 
     def __contains__(self, b: Buffer) -> bool:
         """Return whether Buffer `b` is a known valid buffer."""
@@ -527,18 +884,82 @@ class CompatibilitySession(object):
 
     """Helper class for API compatibility."""
 
+    __slots__ = ('threadsafe_call',)
+
     def __init__(self, nvim: Nvim):
         self.threadsafe_call = nvim.async_call
 
 
+# requests of `Current.snapshot`, in the order of the `CurrentSnapshot` fields
+_CURRENT_METHODS = ('nvim_get_current_line', 'nvim_get_current_buf',
+                    'nvim_get_current_win', 'nvim_get_current_tabpage')
+
+
+class CurrentSnapshot(NamedTuple):
+    """The current line, buffer, window and tabpage, see `Current.snapshot`."""
+
+    line: str
+    buffer: Buffer
+    window: Window
+    tabpage: Tabpage
+
+
 class Current(object):
 
     """Helper class for emulating vim.current from python-vim."""
 
+    __slots__ = ('_session', '_cache', 'range')
+
     def __init__(self, session: Nvim):
         self._session = session
+        self._cache: Optional[Dict[str, Any]] = None
         self.range = None
 
+    @contextmanager
+    def cached(self) -> Iterator[None]:
+        """Reuse the current buffer, window and tabpage within a block.
+
+        Inside the `with` block, each of `buffer`, `window` and `tabpage` is
+        requested at most once. Assigning any of them clears the cache, but
+        changes made by other means (e.g. a `:wincmd` command) are not seen.
+        """
+        outer = self._cache
+        self._cache = {}
+        try:
+            yield
+        finally:
+            self._cache = outer
+
+    def snapshot(self) -> CurrentSnapshot:
+        """Return the current line, buffer, window and tabpage together.
+
+        They are fetched with a single `nvim_call_atomic` request, so they
+        are consistent with each other. Within a `cached` block, the cache
+        is updated with the fetched objects.
+        """
+        nvim = self._session
+        with nvim.batch():
+            results = [nvim.request(method) for method in _CURRENT_METHODS]
+        snapshot = CurrentSnapshot(*[r.result for r in results])
+        if self._cache is not None:
+            self._cache.update(zip(_CURRENT_METHODS[1:], snapshot[1:]))
+        return snapshot
+
+    def _get(self, method: str) -> Any:
+        cache = self._cache
+        if cache is None:
+            return self._session.request(method)
+        try:
+            return cache[method]
+        except KeyError:
+            value = cache[method] = self._session.request(method)
+            return value
+
+    def _set(self, method: str, value: Any) -> None:
+        if self._cache:
+            self._cache.clear()
+        return self._session.request(method, value)
+
     @property
     def line(self) -> str:
         return self._session.request('nvim_get_current_line')
@@ -553,27 +974,27 @@ class Current(object):
 
     @property
     def buffer(self) -> Buffer:
-        return self._session.request('nvim_get_current_buf')
+        return self._get('nvim_get_current_buf')
 
     @buffer.setter
     def buffer(self, buffer: Union[Buffer, int]) -> None:
-        return self._session.request('nvim_set_current_buf', buffer)
+        return self._set('nvim_set_current_buf', buffer)
 
     @property
     def window(self) -> Window:
-        return self._session.request('nvim_get_current_win')
+        return self._get('nvim_get_current_win')
 
     @window.setter
     def window(self, window: Union[Window, int]) -> None:
-        return self._session.request('nvim_set_current_win', window)
+        return self._set('nvim_set_current_win', window)
 
     @property
     def tabpage(self) -> Tabpage:
-        return self._session.request('nvim_get_current_tabpage')
+        return self._get('nvim_get_current_tabpage')
 
     @tabpage.setter
     def tabpage(self, tabpage: Union[Tabpage, int]) -> None:
-        return self._session.request('nvim_set_current_tabpage', tabpage)
+        return self._set('nvim_set_current_tabpage', tabpage)
 
 
 class Funcs:
@@ -583,7 +1004,11 @@ class Funcs:
         self._nvim = nvim
 
     def __getattr__(self, name: str) -> Callable[..., Any]:
-        return partial(self._nvim.call, name)
+        fn = partial(self._nvim.call, name)
+        if not name.startswith('__'):
+            # cache it, later lookups won't reach __getattr__
+            self.__dict__[name] = fn
+        return fn
 
 
 class LuaFuncs:
@@ -592,18 +1017,23 @@ class LuaFuncs:
     def __init__(self, nvim: Nvim, name: str = ""):
         self._nvim = nvim
         self.name = name
+        # the chunks run by __call__, built once since children are cached
+        self._code = "return {}(...)".format(name)
+        self._async_code = "{}(...)".format(name)
 
     def __getattr__(self, name: str) -> LuaFuncs:
         """Return wrapper to named api method."""
         prefix = self.name + "." if self.name else ""
-        return LuaFuncs(self._nvim, prefix + name)
+        child = LuaFuncs(self._nvim, prefix + name)
+        if not name.startswith('__'):
+            # cache it, later lookups won't reach __getattr__
+            self.__dict__[name] = child
+        return child
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         # first new function after keyword rename, be a bit noisy
         if 'async' in kwargs:
             raise ValueError('"async" argument is not allowed. '
                              'Use "async_" instead.')
-        async_ = kwargs.get('async_', False)
-        pattern = "return {}(...)" if not async_ else "{}(...)"
-        code = pattern.format(self.name)
+        code = self._async_code if kwargs.get('async_') else self._code
         return self._nvim.exec_lua(code, *args, **kwargs)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING, Tuple
+from typing import Any, Optional, TYPE_CHECKING, Tuple
 
 from pynvim.api.common import Remote, RemoteSequence
 from pynvim.api.window import Window
@@ -17,7 +17,11 @@ __all__ = ['Tabpage']
 class Tabpage(Remote):
     """A remote Nvim tabpage."""
 
+    __slots__ = ('_windows',)
+
     _api_prefix = "nvim_tabpage_"
+    _vars_methods = ('nvim_tabpage_get_var', 'nvim_tabpage_set_var', 'nvim_tabpage_del_var')
+    _options_methods = ('nvim_tabpage_get_option', 'nvim_tabpage_set_option')
 
     def __init__(self, session: Nvim, code_data: Tuple[int, Any]):
         """Initialize from session and code_data immutable object.
@@ -26,9 +30,15 @@ class Tabpage(Remote):
         msgpack-rpc calls. It must be immutable for Buffer equality to work.
         """
         super(Tabpage, self).__init__(session, code_data)
-        self.windows: RemoteSequence[Window] = RemoteSequence(
-            self, "nvim_tabpage_list_wins"
-        )
+        self._windows: Optional[RemoteSequence[Window]] = None
+
+    @property
+    def windows(self) -> RemoteSequence[Window]:
+        """Get the windows of the tabpage, as a `RemoteSequence`."""
+        windows = self._windows
+        if windows is None:
+            windows = self._windows = RemoteSequence(self, "nvim_tabpage_list_wins")
+        return windows
 
     @property
     def window(self) -> Window:
@@ -2,23 +2,38 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Tuple, cast
+from typing import NamedTuple, TYPE_CHECKING, Tuple, cast
 
 from pynvim.api.buffer import Buffer
 from pynvim.api.common import Remote
 
 if TYPE_CHECKING:
+    from pynvim.api.nvim import Nvim
     from pynvim.api.tabpage import Tabpage
 
 
 __all__ = ['Window']
 
 
+class WindowGeometry(NamedTuple):
+    """Size and on-screen position of a window, see `Window.geometry`."""
+
+    width: int
+    height: int
+    row: int
+    col: int
+
+
 class Window(Remote):
 
     """A remote Nvim window."""
 
+    __slots__ = ()
+
     _api_prefix = "nvim_win_"
+    _vars_methods = ('nvim_win_get_var', 'nvim_win_set_var', 'nvim_win_del_var')
+    _options_methods = ('nvim_win_get_option', 'nvim_win_set_option')
+    _session: "Nvim"
 
     @property
     def buffer(self) -> Buffer:
@@ -55,6 +70,22 @@ class Window(Remote):
         """Set the window height in rows."""
         return self.request('nvim_win_set_width', width)
 
+    @property
+    def position(self) -> Tuple[int, int]:
+        """0-indexed, on-screen window position as (row, col) display cells.
+
+        This takes a single request, prefer it to reading `row` and `col`.
+        """
+        return cast(Tuple[int, int], tuple(self.request('nvim_win_get_position')))
+
+    def geometry(self) -> WindowGeometry:
+        """Return the window size and position with a single request."""
+        with self._session.batch():
+            width = self.request('nvim_win_get_width')
+            height = self.request('nvim_win_get_height')
+            position = self.request('nvim_win_get_position')
+        return WindowGeometry(width.result, height.result, *position.result)
+
     @property
     def row(self) -> int:
         """0-indexed, on-screen window position(row) in display cells."""
@@ -29,6 +29,8 @@ unicode_errors_default = 'surrogateescape'
 
 NUM_TYPES = (int, float)
 
+_MISSING = object()
+
 
 def check_async(async_: Optional[bool], kwargs: Dict[str, Any], default: bool) -> bool:
     """Return a value of 'async' in kwargs or default when async_ is None.
@@ -38,11 +40,11 @@ def check_async(async_: Optional[bool], kwargs: Dict[str, Any], default: bool) -
     """
     if async_ is not None:
         return async_
-    elif 'async' in kwargs:
-        warnings.warn(
-            '"async" attribute is deprecated. Use "async_" instead.',
-            DeprecationWarning,
-        )
-        return kwargs.pop('async')
-    else:
+    value = kwargs.pop('async', _MISSING)
+    if value is _MISSING:
         return default
+    warnings.warn(
+        '"async" attribute is deprecated. Use "async_" instead.',
+        DeprecationWarning,
+    )
+    return value
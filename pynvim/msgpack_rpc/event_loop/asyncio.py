@@ -6,9 +6,8 @@ import asyncio
 import logging
 import os
 import sys
-from collections import deque
 from signal import Signals
-from typing import Any, Callable, Deque, List, Optional, cast
+from typing import Any, Callable, List, Optional, Sequence, Type, cast
 
 if sys.version_info >= (3, 12):
     from typing import Final, override
@@ -20,29 +19,55 @@ from pynvim.msgpack_rpc.event_loop.base import BaseEventLoop, TTransportType
 logger = logging.getLogger(__name__)
 debug, info, warn = (logger.debug, logger.info, logger.warning,)
 
-loop_cls = asyncio.SelectorEventLoop
+loop_cls: Type[asyncio.AbstractEventLoop] = asyncio.SelectorEventLoop
 
 if os.name == 'nt':
-    import msvcrt  # pylint: disable=import-error
-    from asyncio.windows_utils import PipeHandle  # type: ignore[attr-defined]
-
     # On windows use ProactorEventLoop which support pipes and is backed by the
     # more powerful IOCP facility
     # NOTE: we override in the stdio case, because it doesn't work.
-    loop_cls = asyncio.ProactorEventLoop  # type: ignore[attr-defined,misc]
+    loop_cls = asyncio.ProactorEventLoop  # type: ignore[attr-defined]
+elif os.environ.get('NVIM_PYTHON_UVLOOP') != '0':
+    # uvloop is an optional, faster drop-in replacement for the asyncio loop.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        loop_cls = uvloop.Loop
+
+# Only the asyncio selector loop needs a child watcher for child sessions.
+# see #238, #241 (uvloop watches its children by itself)
+use_child_watcher = (os.name != 'nt'
+                     and issubclass(loop_cls, asyncio.SelectorEventLoop))
+
+
+def _get_child_watcher() -> Optional[asyncio.AbstractChildWatcher]:
+    # Looked up for every child session, as the event loop policy (which owns
+    # the watcher) may have changed.
+    try:
+        return asyncio.get_child_watcher()
+    except AttributeError:  # Python 3.14
+        return None
+
+
+# Size of the buffer that protocols read into (see Protocol.get_buffer).
+READ_BUFFER_SIZE = 0x10000
 
 
 # pylint: disable=logging-fstring-interpolation
 
-class Protocol(asyncio.Protocol, asyncio.SubprocessProtocol):
+class Protocol(asyncio.BufferedProtocol, asyncio.SubprocessProtocol):
     """The protocol class used for asyncio-based RPC communication."""
 
+    _buffer: Optional[memoryview]
+
     def __init__(self, on_data, on_error):
         """Initialize the Protocol object."""
         assert on_data is not None
         assert on_error is not None
         self._on_data = on_data
         self._on_error = on_error
+        self._buffer = None
 
     @override
     def connection_made(self, transport):
@@ -56,8 +81,26 @@ class Protocol(asyncio.Protocol, asyncio.SubprocessProtocol):
         self._on_error(exc if exc else EOFError())
 
     @override
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Used by `asyncio.BufferedProtocol` transports to read into."""
+        # Reused for every read; its contents are fed to the unpacker (or the
+        # early data buffer) before the next one, which copies them.
+        buffer = self._buffer
+        if buffer is None:
+            buffer = self._buffer = memoryview(bytearray(READ_BUFFER_SIZE))
+        return buffer
+
+    @override
+    def buffer_updated(self, nbytes: int) -> None:
+        """Used to signal `asyncio.BufferedProtocol` of incoming data."""
+        self._on_data(self._buffer[:nbytes])  # type: ignore[index]
+
     def data_received(self, data: bytes) -> None:
-        """Used to signal `asyncio.Protocol` of incoming data."""
+        """Used to signal `asyncio.Protocol` of incoming data.
+
+        Called by the transports that don't support buffered reads, like the
+        read pipes of the selector event loop.
+        """
         self._on_data(data)
 
     @override
@@ -72,11 +115,11 @@ class Protocol(asyncio.Protocol, asyncio.SubprocessProtocol):
     @override
     def pipe_data_received(self, fd, data):
         """Used to signal `asyncio.SubprocessProtocol` of incoming data."""
-        if fd == 2:  # stderr fd number
+        if fd == 1:  # stdout
+            self._on_data(data)
+        elif fd == 2:  # stderr fd number
             # Ignore stderr message, log only for debugging
             debug("stderr: %s", str(data))
-        elif fd == 1:  # stdout
-            self.data_received(data)
 
     @override
     def process_exited(self) -> None:
@@ -90,8 +133,8 @@ class AsyncioEventLoop(BaseEventLoop):
 
     _protocol: Optional[Protocol]
     _transport: Optional[asyncio.WriteTransport]
-    _signals: List[Signals]
-    _data_buffer: Deque[bytes]
+    _signals: Sequence[Signals]
+    _data_buffer: bytearray
     if os.name != 'nt':
         _child_watcher: Optional[asyncio.AbstractChildWatcher]
 
@@ -102,21 +145,26 @@ class AsyncioEventLoop(BaseEventLoop):
 
         # The underlying asyncio event loop.
         self._loop: Final[asyncio.AbstractEventLoop] = loop_cls()
-
-        # Handle messages from nvim that may arrive before run() starts.
-        self._data_buffer = deque()
-
-        def _on_data(data: bytes) -> None:
-            if self._on_data is None:
-                self._data_buffer.append(data)
-                return
-            self._on_data(data)
-
-        # pylint: disable-next=unnecessary-lambda
-        self._protocol_factory = lambda: Protocol(
-            on_data=_on_data,
-            on_error=self._on_error,
-        )
+        self._call_soon = self._loop.call_soon
+        self._call_soon_threadsafe = self._loop.call_soon_threadsafe
+
+        # Handle messages from nvim that may arrive before run() starts. The
+        # chunks are accumulated in a single buffer, fed at once by _run.
+        self._data_buffer = bytearray()
+        self._buffer_data = self._data_buffer.extend
+
+        # Protocols buffer the data received while the loop is not running.
+        # While it runs, they pass the data straight to the `on_data`
+        # callback, without going through this class (see _run).
+        self._protocols: List[Protocol] = []
+
+        def _protocol_factory() -> Protocol:
+            protocol = Protocol(on_data=self._buffer_data,
+                                on_error=self._on_error)
+            self._protocols.append(protocol)
+            return protocol
+
+        self._protocol_factory = _protocol_factory
         self._protocol = None
 
         # The communication channel (endpoint) created by _connect_*() methods,
@@ -125,8 +173,19 @@ class AsyncioEventLoop(BaseEventLoop):
         self._to_close: List[asyncio.BaseTransport] = []
         self._child_watcher = None
 
+        # While the loop runs, the messages sent by the callbacks are queued
+        # and written at once when they are done (see _run and _queue_send).
+        self._send_queue: List[bytes] = []
+
         super().__init__(transport_type, *args, **kwargs)
 
+        # Every message goes through _send, write to the transport directly.
+        # (the _connect_* method that was called has set the transport)
+        transport = cast(asyncio.WriteTransport, self._transport)
+        self._write = transport.write
+        self._writelines = transport.writelines
+        self._send = self._write  # type: ignore[method-assign]
+
     @override
     def _connect_tcp(self, address: str, port: int) -> None:
         async def connect_tcp():
@@ -156,6 +215,11 @@ class AsyncioEventLoop(BaseEventLoop):
 
     @override
     def _connect_stdio(self) -> None:
+        if os.name == 'nt':
+            # only needed here, not imported along with the module
+            import msvcrt  # pylint: disable=import-error
+            from asyncio.windows_utils import PipeHandle  # type: ignore[attr-defined]
+
         async def connect_stdin():
             if os.name == 'nt':
                 pipe = PipeHandle(msvcrt.get_osfhandle(sys.stdin.fileno()))
@@ -166,7 +230,6 @@ class AsyncioEventLoop(BaseEventLoop):
             debug("native stdin connection successful")
             self._to_close.append(transport)
             del protocol
-        self._loop.run_until_complete(connect_stdin())
 
         # Make sure subprocesses don't clobber stdout,
         # send the output to stderr instead.
@@ -184,21 +247,16 @@ class AsyncioEventLoop(BaseEventLoop):
             debug("native stdout connection successful")
             self._transport = transport
             self._protocol = protocol
-        self._loop.run_until_complete(connect_stdout())
+
+        # Both pipes are connected in a single run of the loop.
+        async def connect_stdio():
+            await asyncio.gather(connect_stdin(), connect_stdout())
+        self._loop.run_until_complete(connect_stdio())
 
     @override
     def _connect_child(self, argv: List[str]) -> None:
-        def get_child_watcher():
-            try:
-                return asyncio.get_child_watcher()
-            except AttributeError:  # Python 3.14
-                return None
-
-            return None
-
-        if os.name != 'nt':
-            # see #238, #241
-            watcher = get_child_watcher()
+        if use_child_watcher:
+            watcher = _get_child_watcher()
             if watcher is not None:
                 watcher.attach_loop(self._loop)
                 self._child_watcher = watcher
@@ -228,25 +286,45 @@ class AsyncioEventLoop(BaseEventLoop):
         # been established
         self._loop.run_until_complete(create_subprocess())
 
-    @override
-    def _start_reading(self) -> None:
-        pass
-
     @override
     def _send(self, data: bytes) -> None:
         assert self._transport, "connection has not been established."
         self._transport.write(data)
 
+    def _queue_send(self, data: bytes) -> None:
+        queue = self._send_queue
+        queue.append(data)
+        if len(queue) == 1:
+            self._call_soon(self._flush_send)
+
+    def _flush_send(self) -> None:
+        queue = self._send_queue
+        if queue:
+            self._writelines(queue)
+            queue.clear()
+
     @override
     def _run(self) -> None:
         # process the early messages that arrived as soon as the transport
         # channels are open and on_data is fully ready to receive messages.
-        while self._data_buffer:
-            data: bytes = self._data_buffer.popleft()
-            if self._on_data is not None:
-                self._on_data(data)
-
-        self._loop.run_forever()
+        on_data = self._on_data
+        assert on_data is not None
+        if self._data_buffer:
+            data = bytes(self._data_buffer)
+            self._data_buffer.clear()
+            on_data(data)
+
+        protocols = self._protocols
+        for protocol in protocols:
+            protocol._on_data = on_data
+        self._send = self._queue_send  # type: ignore[method-assign]
+        try:
+            self._loop.run_forever()
+        finally:
+            self._send = self._write  # type: ignore[method-assign]
+            self._flush_send()
+            for protocol in protocols:
+                protocol._on_data = self._buffer_data
 
     @override
     def _stop(self) -> None:
@@ -263,14 +341,23 @@ class AsyncioEventLoop(BaseEventLoop):
             if (sys.version_info < (3, 13) and
                     os.name == 'nt' and hasattr(transport, '_sock')):
                 async def wait_until_closed():
+                    # The transport is usually closed by a callback that
+                    # close() has scheduled right away, so check again after
+                    # one iteration before polling (e.g. for pending writes).
+                    delay = 0.0
                     # pylint: disable-next=protected-access
                     while transport._sock is not None:
-                        await asyncio.sleep(0.01)
+                        await asyncio.sleep(delay)
+                        delay = 0.01
                 self._loop.run_until_complete(wait_until_closed())
 
         if self._transport:
             _close_transport(self._transport)
             self._transport = None
+        # drop the bound writers of the closed transport: _send is the
+        # method again, which refuses to send without a transport.
+        for name in ('_send', '_write', '_writelines'):
+            self.__dict__.pop(name, None)
         for transport in self._to_close:
             _close_transport(transport)
         self._to_close[:] = []
@@ -283,16 +370,25 @@ class AsyncioEventLoop(BaseEventLoop):
 
     @override
     def _threadsafe_call(self, fn: Callable[[], Any]) -> None:
-        self._loop.call_soon_threadsafe(fn)
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            # Already on the loop thread (e.g. a handler deferring work with
+            # nvim.async_call), no need to lock and wake up the loop.
+            self._call_soon(fn)
+        else:
+            self._call_soon_threadsafe(fn)
 
     @override
-    def _setup_signals(self, signals: List[Signals]) -> None:
+    def _setup_signals(self, signals: Sequence[Signals]) -> None:
         if os.name == 'nt':
             # add_signal_handler is not supported in win32
-            self._signals = []
+            self._signals = ()
             return
 
-        self._signals = list(signals)
+        self._signals = signals
         for signum in self._signals:
             self._loop.add_signal_handler(signum, self._on_signal, signum)
 
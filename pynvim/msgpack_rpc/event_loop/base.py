@@ -4,7 +4,7 @@ import signal
 import sys
 import threading
 from abc import ABC, abstractmethod
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 if sys.version_info < (3, 8):
     from typing_extensions import Literal
@@ -20,6 +20,13 @@ debug, info, warn = (logger.debug, logger.info, logger.warning,)
 # default state, we keep a reference to the default handler
 default_int_handler = signal.getsignal(signal.SIGINT)
 main_thread = threading.current_thread()
+main_thread_id = main_thread.ident
+
+# the signals handled while the loop runs in the main thread
+loop_signals = (signal.SIGINT, signal.SIGTERM)
+# signal numbers to names, for logging
+signames = dict((v, k) for k, v in signal.__dict__.items()
+                if k.startswith('SIG') and not k.startswith('SIG_'))
 
 TTransportType = Union[
     Literal['stdio'],
@@ -61,8 +68,6 @@ class BaseEventLoop(ABC):
     - `_connect_stdio()`: Use stdin/stdout as the connection to Nvim
     - `_connect_child(argv)`: Use the argument vector `argv` to spawn an
       embedded Nvim that has its stdin/stdout connected to the event loop.
-    - `_start_reading()`: Called after any of _connect_* methods. Can be used
-      to perform any post-connection setup or validation.
     - `_send(data)`: Send `data` (byte array) to Nvim (usually RPC request).
     - `_run()`: Runs the event loop until stopped or the connection is closed.
       The following methods can be called upon some events by the event loop:
@@ -77,10 +82,14 @@ class BaseEventLoop(ABC):
     - `_interrupt(data)`: Like `stop()`, but may be called from other threads
       this.
     - `_setup_signals(signals)`: Add implementation-specific listeners for
-      for `signals`, which is a list of OS-specific signal numbers.
+      for `signals`, which is a sequence of OS-specific signal numbers.
     - `_teardown_signals()`: Removes signal listeners set by `_setup_signals`
     """
 
+    # AsyncioEventLoop doesn't define slots and keeps a __dict__: it rebinds
+    # methods such as _send on its instances, which slots can't shadow.
+    __slots__ = ('_transport_type', '_on_data', '_error')
+
     def __init__(self, transport_type: TTransportType, *args: Any, **kwargs: Any):
         """Initialize and connect the event loop instance.
 
@@ -95,23 +104,22 @@ class BaseEventLoop(ABC):
         Implementation-specific initialization should be made in the __init__
         constructor of the subclass, which must call the constructor of the
         super class (BaseEventLoop), in which one of the `_connect_*` methods
-        (based on `transport_type`) and then `_start_reading()`.
+        (based on `transport_type`) is called.
         """
         self._transport_type = transport_type
-        self._signames = dict((k, v) for v, k in signal.__dict__.items()
-                              if v.startswith('SIG'))
         self._on_data: Optional[Callable[[bytes], None]] = None
         self._error: Optional[BaseException] = None
+        connectors: Dict[TTransportType, Callable[..., None]] = {
+            'tcp': self._connect_tcp,
+            'socket': self._connect_socket,
+            'stdio': self._connect_stdio,
+            'child': self._connect_child,
+        }
         try:
-            getattr(self, '_connect_{}'.format(transport_type))(*args, **kwargs)
+            connectors[transport_type](*args, **kwargs)
         except Exception as e:
             self.close()
             raise e
-        self._start_reading()
-
-    @abstractmethod
-    def _start_reading(self) -> None:
-        raise NotImplementedError()
 
     @abstractmethod
     def _send(self, data: bytes) -> None:
@@ -184,15 +192,19 @@ class BaseEventLoop(ABC):
 
         # data_cb: e.g., MsgpackStream._on_data
         self._on_data = data_cb
-        if threading.current_thread() == main_thread:
-            self._setup_signals([signal.SIGINT, signal.SIGTERM])
+        # the loop runs for every blocking request, compare the cheap idents
+        in_main_thread = threading.get_ident() == main_thread_id
+        if in_main_thread:
+            self._setup_signals(loop_signals)
         debug('Entering event loop')
-        self._run()
-        debug('Exited event loop')
-        if threading.current_thread() == main_thread:
-            self._teardown_signals()
-            signal.signal(signal.SIGINT, default_int_handler)
-        self._on_data = None
+        try:
+            self._run()
+        finally:
+            debug('Exited event loop')
+            if in_main_thread:
+                self._teardown_signals()
+                signal.signal(signal.SIGINT, default_int_handler)
+            self._on_data = None
 
     @abstractmethod
     def _run(self) -> None:
@@ -217,9 +229,8 @@ class BaseEventLoop(ABC):
         raise NotImplementedError()
 
     def _on_signal(self, signum: signal.Signals) -> None:
-        # pylint: disable-next=consider-using-f-string
-        msg = 'Received signal {}'.format(self._signames[signum])
-        debug(msg)
+        name = signames.get(signum, signum)
+        debug('Received signal %s', name)
 
         if signum == signal.SIGINT and self._transport_type == 'stdio':
             # When the transport is stdio, we are probably running as a Nvim
@@ -230,7 +241,8 @@ class BaseEventLoop(ABC):
         if signum == signal.SIGINT:
             self._error = KeyboardInterrupt()
         else:
-            self._error = Exception(msg)
+            # pylint: disable-next=consider-using-f-string
+            self._error = Exception('Received signal {}'.format(name))
         self.stop()
 
     def _on_error(self, exc: Exception) -> None:
@@ -241,7 +253,7 @@ class BaseEventLoop(ABC):
     def _on_interrupt(self) -> None:
         self.stop()
 
-    def _setup_signals(self, signals: List[signal.Signals]) -> None:
+    def _setup_signals(self, signals: Sequence[signal.Signals]) -> None:
         pass  # no-op by default
 
     def _teardown_signals(self) -> None:
@@ -1,13 +1,50 @@
 """Msgpack handling in the event loop pipeline."""
 import logging
+import threading
+from typing import Any, Callable, Optional, Type
 
-from msgpack import Packer, Unpacker
+from msgpack import ExtType, Packer, Unpacker
 
 from pynvim.compat import unicode_errors_default
 from pynvim.msgpack_rpc.event_loop.base import BaseEventLoop
 
 logger = logging.getLogger(__name__)
 debug, info, warn = (logger.debug, logger.info, logger.warning,)
+is_enabled_for, DEBUG = logger.isEnabledFor, logging.DEBUG
+
+
+def _ext_hook(code: int, data: bytes, _new: Callable[..., Any] = tuple.__new__,
+              _cls: Type[ExtType] = ExtType) -> ExtType:
+    # Same as the default `ExtType(code, data)`, without the argument checks
+    # of `ExtType.__new__`: the unpacker always passes an int and bytes. Every
+    # buffer/window/tabpage handle received goes through here.
+    return _new(_cls, (code, data))
+
+
+def _pack_default(obj: Any) -> ExtType:
+    # Called by the packer for objects it can't serialize. Buffer, Window and
+    # Tabpage objects of the API layer keep the ext value they were received
+    # as in `code_data`, so payloads containing them are sent without being
+    # converted beforehand.
+    try:
+        code_data = obj.code_data
+    except AttributeError:
+        raise TypeError("can not serialize {!r} object"
+                        .format(type(obj).__name__)) from None
+    return ExtType(*code_data)
+
+
+class _ThreadPackers(threading.local):
+    # Packers have a large internal buffer, so the streams share one per
+    # thread. Packing doesn't keep state between messages, and the packer of
+    # the thread sending a message is used, so concurrent sends on streams run
+    # by different threads don't share a packer.
+    def __init__(self) -> None:
+        self.packer = Packer(default=_pack_default,
+                             unicode_errors=unicode_errors_default)
+
+
+_packers = _ThreadPackers()
 
 
 class MsgpackStream:
@@ -17,12 +54,21 @@ class MsgpackStream:
     exposes an interface for reading/writing msgpack documents.
     """
 
+    __slots__ = ('loop', '_unpacker', '_message_cb', '_feed', '_loop_send',
+                 '_bound_on_data')
+
     def __init__(self, event_loop: BaseEventLoop) -> None:
         """Wrap `event_loop` on a msgpack-aware interface."""
         self.loop = event_loop
-        self._packer = Packer(unicode_errors=unicode_errors_default)
-        self._unpacker = Unpacker(unicode_errors=unicode_errors_default)
-        self._message_cb = None
+        # raw=False: msgpack strings are decoded to `str` right away, so only
+        # binary values are left to the decoding step of the API layer.
+        self._unpacker = Unpacker(raw=False, use_list=True, ext_hook=_ext_hook,
+                                  unicode_errors=unicode_errors_default)
+        self._message_cb: Optional[Callable[[Any], None]] = None
+        # bound once, used for every message
+        self._feed = self._unpacker.feed
+        self._loop_send = event_loop.send
+        self._bound_on_data = self._on_data
 
     def threadsafe_call(self, fn):
         """Wrapper around `BaseEventLoop.threadsafe_call`."""
@@ -30,8 +76,9 @@ class MsgpackStream:
 
     def send(self, msg):
         """Queue `msg` for sending to Nvim."""
-        debug('sending %s', msg)
-        self.loop.send(self._packer.pack(msg))
+        if is_enabled_for(DEBUG):
+            debug('sending %s', msg)
+        self._loop_send(_packers.packer.pack(msg))
 
     def run(self, message_cb):
         """Run the event loop to receive messages from Nvim.
@@ -40,7 +87,7 @@ class MsgpackStream:
         a message has been successfully parsed from the input stream.
         """
         self._message_cb = message_cb
-        self.loop.run(self._on_data)
+        self.loop.run(self._bound_on_data)
         self._message_cb = None
 
     def stop(self):
@@ -52,14 +99,15 @@ class MsgpackStream:
         self.loop.close()
 
     def _on_data(self, data: bytes) -> None:
-        self._unpacker.feed(data)
-        while True:
-            try:
-                debug('waiting for message...')
-                msg = next(self._unpacker)
+        self._feed(data)
+        message_cb = self._message_cb
+        assert message_cb is not None
+        # checked once per chunk, not for every message in it
+        log = is_enabled_for(DEBUG)
+        # iterating stops without raising StopIteration at each chunk's end
+        for msg in self._unpacker:
+            if log:
                 debug('received message: %s', msg)
-                assert self._message_cb is not None
-                self._message_cb(msg)  # type: ignore[unreachable]
-            except StopIteration:
-                debug('unpacker needs more data...')
-                break
+            message_cb(msg)
+        if log:
+            debug('unpacker needs more data...')
@@ -61,6 +61,7 @@ class Session:
         self._is_running = False
         self._setup_exception: Optional[Exception] = None
         self._loop_thread: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
         self.error_wrapper: Callable[[Tuple[int, str]], Exception] = \
             lambda e: Exception(e[1])
 
@@ -102,7 +103,8 @@ class Session:
             return self._pending_messages.popleft()
         return None
 
-    def request(self, method: AnyStr, *args: Any, **kwargs: Any) -> Any:
+    def request(self, method: AnyStr, *args: Any, async_: Optional[bool] = None,
+                **kwargs: Any) -> Any:
         """Send a msgpack-rpc request and block until as response is received.
 
         If the event loop is running, this method must have been called by a
@@ -120,7 +122,8 @@ class Session:
         is sent instead. This will never block, and the return value or error
         is ignored.
         """
-        async_ = check_async(kwargs.pop('async_', None), kwargs, False)
+        if kwargs:
+            async_ = check_async(async_, kwargs, False)
         if async_:
             self._async_session.notify(method, args)
             return
@@ -156,6 +159,7 @@ class Session:
         self._is_running = True
         self._setup_exception = None
         self._loop_thread = threading.current_thread()
+        self._loop_thread_id = threading.get_ident()
 
         def on_setup() -> None:
             try:
@@ -184,6 +188,7 @@ class Session:
         self._request_cb = None
         self._notification_cb = None
         self._loop_thread = None
+        self._loop_thread_id = None
 
         if self._setup_exception:
             raise self._setup_exception
@@ -13,7 +13,7 @@ from functools import partial
 from traceback import format_exc
 from typing import Any, Sequence
 
-from pynvim.api import Nvim, decode_if_bytes, walk
+from pynvim.api import Nvim, decode_if_bytes, walk_decode
 from pynvim.msgpack_rpc import ErrorResponse
 from pynvim.plugin import script_host
 from pynvim.util import format_exc_skip, get_client_info
@@ -111,8 +111,10 @@ class Host(object):
             return self._notification_handlers[name](*args)
 
     def _wrap_function(self, fn, sync, decode, nvim_bind, name, *args):
-        if decode:
-            args = walk(partial(decode_if_bytes, mode=decode), args)
+        if decode is True:
+            args = walk_decode(args)
+        elif decode:
+            args = walk_decode(args, decode)
         if nvim_bind is not None:
             args.insert(0, nvim_bind)
         try:
@@ -1,8 +1,8 @@
 """Shared utility functions."""
 
 import sys
-from traceback import format_exception
-from typing import Any, Dict, Optional, Tuple, TypeVar
+from traceback import StackSummary, format_exception
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
 
 from pynvim._version import VERSION
 
@@ -16,6 +16,31 @@ def format_exc_skip(skip: int, limit: Optional[int] = None) -> str:
     return ("".join(format_exception(etype, val, tb, limit))).rstrip()
 
 
+TStackEntry = Tuple[str, int, str, None]
+
+
+def capture_stack(skip: int, limit: int) -> List[TStackEntry]:
+    """Capture the caller's stack cheaply, for `format_captured_stack`.
+
+    Only the file names, line numbers and function names are recorded,
+    reading the source lines is left to formatting. `skip` frames above the
+    caller are left out, and at most `limit` frames are kept.
+    """
+    frame = sys._getframe(skip + 1)
+    entries: List[TStackEntry] = []
+    while frame is not None and len(entries) < limit:
+        code = frame.f_code
+        entries.append((code.co_filename, frame.f_lineno, code.co_name, None))
+        frame = frame.f_back  # type: ignore[assignment]
+    entries.reverse()
+    return entries
+
+
+def format_captured_stack(entries: List[TStackEntry]) -> str:
+    """Format a stack captured by `capture_stack` like format_stack does."""
+    return ''.join(StackSummary.from_list(entries).format())
+
+
 T1 = TypeVar("T1")
 T2 = TypeVar("T2")
 
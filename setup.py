@@ -32,6 +32,7 @@ docs_require = [
 extras_require = {
     'test': tests_require,
     'docs': docs_require,
+    'uvloop': ['uvloop; platform_system != "Windows"'],
 }
 
 
@@ -186,6 +186,15 @@ def test_set_items_for_range(vim: Nvim) -> None:
     assert vim.current.buffer[:] == ['a', 'foo', 'foo', 'foo', 'd', 'e']
 
 
+def test_iter_range(vim: Nvim) -> None:
+    vim.current.buffer[:] = ['a', 'b', 'c', 'd', 'e']
+    r = vim.current.buffer.range(2, 4)
+    assert len(r) == 3
+    assert list(r) == ['b', 'c', 'd']
+    with pytest.raises(NvimError):
+        list(vim.current.buffer.range(4, 7))
+
+
 # NB: we can't easily test the effect of this. But at least run the lua
 # function sync, so we know it runs without runtime error with simple args.
 def test_update_highlights(vim: Nvim) -> None:
@@ -18,11 +18,13 @@ def test_vars(vim: Nvim) -> None:
     assert vim.current.tabpage.vars['python'] == [1, 2, {'3': 1}]
     assert vim.eval('t:python') == [1, 2, {'3': 1}]
     assert vim.current.tabpage.vars.get('python') == [1, 2, {'3': 1}]
+    assert 'python' in vim.current.tabpage.vars
 
     del vim.current.tabpage.vars['python']
     with pytest.raises(KeyError):
         vim.current.tabpage.vars['python']
     assert vim.eval('exists("t:python")') == 0
+    assert 'python' not in vim.current.tabpage.vars
 
     with pytest.raises(KeyError):
         del vim.current.tabpage.vars['python']
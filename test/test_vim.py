@@ -4,6 +4,7 @@ import os
 import sys
 import tempfile
 from pathlib import Path
+from typing import Any, List
 
 import pytest
 
@@ -74,6 +75,51 @@ def test_call(vim: Nvim) -> None:
 def test_api(vim: Nvim) -> None:
     vim.api.command('let g:var = 3')
     assert vim.api.eval('g:var') == 3
+    assert vim.api.eval is vim.api.eval
+
+
+def test_batch(vim: Nvim) -> None:
+    vim.current.buffer[:] = ['alpha', 'beta']
+    with vim.batch():
+        vim.api.set_var('batched', 3)
+        count = vim.current.buffer.api.line_count()
+        var = vim.api.get_var('batched')
+    assert count.result == 2
+    assert var.result == 3
+
+    with pytest.raises(NvimError):
+        with vim.batch():
+            missing = vim.api.get_var('nosuchvar')
+    with pytest.raises(NvimError):
+        missing.result
+
+    # the error is raised even if a notification sent the requests earlier
+    with pytest.raises(NvimError):
+        with vim.batch():
+            vim.api.get_var('nosuchvar')
+            vim.api.set_var('notified', 1, async_=True)
+
+    # nested batches join the outer one, keeping the requests in order
+    with vim.batch():
+        vim.api.set_var('batched', 4)
+        with vim.batch():
+            inner = vim.api.get_var('batched')
+        vim.api.set_var('batched', 5)
+    assert inner.result == 4
+    assert vim.vars['batched'] == 5
+
+    # the requests of a block that raised are discarded
+    with pytest.raises(ValueError):
+        with vim.batch():
+            discarded = vim.api.get_var('batched')
+            raise ValueError()
+    with pytest.raises(NvimError):
+        discarded.result
+
+    # testing a deferred result fails loudly
+    with vim.batch():
+        with pytest.raises(TypeError):
+            'batched' in vim.vars
 
 
 def test_strwidth(vim: Nvim) -> None:
@@ -93,6 +139,26 @@ def test_chdir(vim: Nvim) -> None:
     assert vim.eval('getcwd()') == pwd
 
 
+def test_cached_rtp(vim: Nvim, monkeypatch: Any) -> None:
+    paths = vim.list_runtime_paths()
+    sent: List[str] = []
+    request = vim.request
+
+    def counting_request(name: str, *args: Any, **kwargs: Any) -> Any:
+        sent.append(name)
+        return request(name, *args, **kwargs)
+
+    monkeypatch.setattr(vim, 'request', counting_request)
+    with vim.cached_rtp():
+        assert vim.list_runtime_paths() == paths
+        found: List[str] = []
+        vim.foreach_rtp(found.append)
+        assert found == paths
+    assert sent == ['nvim_list_runtime_paths']
+    vim.list_runtime_paths()
+    assert sent == ['nvim_list_runtime_paths'] * 2
+
+
 def test_current_line(vim: Nvim) -> None:
     assert vim.current.line == ''
     vim.current.line = 'abc'
@@ -108,13 +174,36 @@ def test_current_line_delete(vim: Nvim) -> None:
     assert len(vim.current.buffer[:]) == 1 and not vim.current.buffer[0]
 
 
+def test_current_cached(vim: Nvim) -> None:
+    first = vim.current.buffer
+    with vim.current.cached():
+        assert vim.current.buffer == first
+        vim.command('new')
+        # not seen, as it was not made through vim.current
+        assert vim.current.buffer == first
+        vim.current.window = vim.windows[0]
+        assert vim.current.buffer != first
+    assert vim.current.buffer == vim.windows[0].buffer
+
+
+def test_current_snapshot(vim: Nvim) -> None:
+    vim.current.line = 'abc'
+    snapshot = vim.current.snapshot()
+    assert snapshot.line == 'abc'
+    assert snapshot.buffer == vim.current.buffer
+    assert snapshot.window == vim.current.window
+    assert snapshot.tabpage == vim.current.tabpage
+
+
 def test_vars(vim: Nvim) -> None:
     vim.vars['python'] = [1, 2, {'3': 1}]
     assert vim.vars['python'] == [1, 2, {'3': 1}]
     assert vim.eval('g:python') == [1, 2, {'3': 1}]
     assert vim.vars.get('python') == [1, 2, {'3': 1}]
+    assert 'python' in vim.vars
 
     del vim.vars['python']
+    assert 'python' not in vim.vars
     with pytest.raises(KeyError):
         vim.vars['python']
     assert vim.eval('exists("g:python")') == 0
@@ -127,6 +216,8 @@ def test_vars(vim: Nvim) -> None:
 
 def test_options(vim: Nvim) -> None:
     assert vim.options['background'] == 'dark'
+    assert 'background' in vim.options
+    assert 'nosuchoption' not in vim.options
     vim.options['background'] = 'light'
     assert vim.options['background'] == 'light'
 
@@ -154,6 +245,13 @@ def test_buffers(vim: Nvim) -> None:
     vim.current.buffer = buffers[0]
     assert vim.buffers[vim.current.buffer.number] == buffers[0]
 
+    class Number(int):
+        pass
+
+    assert vim.buffers[Number(buffers[1].number)] == buffers[1]
+    with pytest.raises(KeyError):
+        vim.buffers['1']  # type: ignore[index]
+
     # Membership test
     assert buffers[0] in vim.buffers
     assert buffers[1] in vim.buffers
@@ -83,6 +83,11 @@ def test_position(vim: Nvim) -> None:
     assert vsplit_pos - 1 <= vim.windows[1].col <= vsplit_pos + 1
     assert split_pos - 1 <= vim.windows[2].row <= split_pos + 1
     assert vim.windows[2].col == 0
+    assert vim.windows[2].position == (vim.windows[2].row, 0)
+    geometry = vim.windows[1].geometry()
+    assert geometry.width == vim.windows[1].width
+    assert geometry.height == vim.windows[1].height
+    assert (geometry.row, geometry.col) == vim.windows[1].position
 
 
 def test_tabpage(vim: Nvim) -> None: